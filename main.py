@@ -2,9 +2,11 @@
 import sys
 import threading
 import queue
+import collections
+from concurrent.futures import ThreadPoolExecutor
 import time
-import random
 import tkinter as tk
+import numpy as np
 from PIL import Image, ImageTk
 
 try:
@@ -13,8 +15,22 @@ try:
 except Exception:
     SERIAL_AVAILABLE = False
 
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda f: f
+
 
+DEBUG = False                  # informational console traces (TX, input/test mode changes)
+LOG_ERRORS = True              # serial open/read/write failures
 FPS = 60
+FRAME_DT = 1.0 / FPS
+BEHIND_DT = 1.5 * FRAME_DT     # render interval past which every other draw is skipped
+PHYS_DT = 1.0 / 120            # fixed physics step, independent of the render rate
+MAX_FRAME_LAG = 0.25           # cap on simulated time per frame after a stall
+SLEEP_RING_MASK = 63           # after() oversleep history, 64 frames (power of two for the mask)
+LOGIC_MS = 5                   # input drain + physics tick, decoupled from the render rate
 WIDTH, HEIGHT = 400, 600
 GRAVITY = 900.0
 FLAP_VY = -320.0
@@ -23,9 +39,150 @@ PIPE_SPEED = 140.0
 PIPE_INTERVAL = 1.5
 SERIAL_BAUD = 115200
 DEFAULT_SERIAL_PORT = "COM4"   # change if needed
+# asset set -> (background, pipe sprite, pipe downscale, bird sprite, bird downscale)
+ASSET_SETS = {
+    "default": ("background.jpeg", "pipe2.png", 3, "bird.png", 8),
+    "alt": ("background1.png", "pipe.png", 3, "bird1.png", 8),
+}
+BG_SCROLL_SPEED = 60.0         # px/s
 INPUT_DEVICES = ["Push Button", "Infrared Sensor", "Digital Encoder", "Ultrasound Sensor"]
+BIRD_X = WIDTH // 4
+BIRD_X_LEFT, BIRD_X_RIGHT = BIRD_X - 10, BIRD_X + 10
+GAP_Y_MIN, GAP_Y_MAX = 100, HEIGHT - PIPE_GAP - 100
+GAP_Y_STEP = 20                # gap positions are snapped to this grid, one pipe image each
+# pipes are at least PIPE_SPACING apart; _collide assumes that is more than pipe_w + the bird
+# width, so at most one pipe overlaps the bird (checked in FlappyApp.__init__ once pipe_w is known)
+PIPE_SPACING = PIPE_SPEED * PIPE_INTERVAL
+PIPE_RESPAWN_X = WIDTH - PIPE_SPACING
+GAP_POOL_SIZE = 256            # pre-drawn gap positions, cycled through at spawn time
+MAX_PIPES = 5                  # pipe slots (and canvas item pairs), enough for a full screen
+BIRD_ANGLE_MIN, BIRD_ANGLE_MAX, BIRD_ANGLE_STEP = -20, 60, 2   # pre-rotated sprite range
+# sensor value -> target bird_y, over the clamped range of each sensor
+SENSOR_Y30 = tuple(v * (HEIGHT - 50) / 30.0 for v in range(31))                      # IR 0..30, ENC offset -15..15
+ULTRA_Y = tuple((HEIGHT - 50) - v * (HEIGHT - 50) / 50.0 for v in range(51))         # ULTRA 0..50
+
+# serial line prefix (bytes before ':') -> (queue message, value parser)
+SERIAL_TAGS = {
+    b"BTN": ("BTN", None),
+    b"BTN1": ("BTN1", None),
+    b"BTN2": ("BTN2", None),
+    b"IR": ("IR", int),
+    b"ENC": ("ENC", int),
+    b"ULTRA": ("ULTRA", int),
+    b"US": ("ULTRA", int),
+    b"MAX": ("MAX", int),
+}
+
+
+
+@njit(cache=True)
+def _move_pipes(pipe_x, dx, pipe_w):
+    """Avance les tuyaux de dx, libère ceux sortis de l'écran, renvoie le x du plus à droite"""
+    last_x = -np.inf
+    for i in range(pipe_x.shape[0]):
+        x = pipe_x[i]
+        if x == np.inf:
+            continue
+        x -= dx
+        if x + pipe_w <= 0:
+            pipe_x[i] = np.inf
+            continue
+        pipe_x[i] = x
+        if x > last_x:
+            last_x = x
+    return last_x
+
+
+@njit(cache=True)
+def _collide(pipe_x, pipe_gap_y, pipe_scored, bird_y, pipe_w):
+    """Marque les tuyaux dépassés, renvoie (collision, points gagnés)"""
+    if bird_y <= 0 or bird_y >= HEIGHT:
+        return True, 0
+    gained = 0
+    for i in range(pipe_x.shape[0]):
+        px1 = pipe_x[i]
+        if px1 == np.inf:
+            continue
+        px2 = px1 + pipe_w
+        passed = px2 < BIRD_X_LEFT
+        # branchless: count the pipe once, on the step it is first passed
+        gained += passed & ~pipe_scored[i]
+        pipe_scored[i] |= passed
+        if not passed and px1 <= BIRD_X_RIGHT:
+            # pipes are spaced wider than the bird: this is the only one it can touch,
+            # anything left to scan gets scored on the next step
+            gy = pipe_gap_y[i]
+            return bird_y < gy or bird_y > gy + PIPE_GAP, gained
+    return False, gained
+
+
+@njit(cache=True)
+def _step(pipe_x, pipe_gap_y, pipe_scored, bird_y, bird_vy, angle, dt, pipe_w, target, follow, check):
+    """Un pas de physique fusionné : oiseau, tuyaux puis collisions"""
+    if follow:
+        bird_y += (target - bird_y) * 8 * dt
+    else:
+        bird_vy += GRAVITY * dt
+        bird_y += bird_vy * dt
+        t = bird_vy * 0.15    # (vy / 400) * 60 degrees
+        tilt = BIRD_ANGLE_MIN if t < BIRD_ANGLE_MIN else (BIRD_ANGLE_MAX if t > BIRD_ANGLE_MAX else t)
+        angle += (tilt - angle) * 5 * dt
+    last_x = _move_pipes(pipe_x, PIPE_SPEED * dt, pipe_w)
+    collided = False
+    gained = 0
+    if check:
+        collided, gained = _collide(pipe_x, pipe_gap_y, pipe_scored, bird_y, pipe_w)
+    return bird_y, bird_vy, angle, last_x, collided, gained
+
+
+def _load_background(path):
+    try:
+        bg_base = Image.open(path)
+    except Exception:
+        bg_base = Image.new("RGB", (WIDTH, HEIGHT), (135, 206, 235))
+    size = (bg_base.width * HEIGHT // bg_base.height, HEIGHT)
+    bg_base.draft("RGB", size)   # JPEG: let the decoder downscale by a power of two first
+    return bg_base.resize(size, Image.BILINEAR)
 
 
+def _load_sprite(path, divisor, fallback_size, fallback_color):
+    try:
+        base = Image.open(path)
+        # one-shot integer downscale of small sprites: BILINEAR is indistinguishable from LANCZOS here
+        return base.resize((base.width // divisor, base.height // divisor), Image.BILINEAR)
+    except Exception:
+        return Image.new("RGBA", fallback_size, fallback_color)
+
+
+class ScrollingBackground:
+    """Fond tuilé une seule fois et défilé en déplaçant un unique item du canvas"""
+    __slots__ = ('width', 'scroll_x', 'photo', 'item', '_drawn_x', '_tkcall', '_cw')
+
+    def __init__(self, canvas, image):
+        self.width = image.width
+        self.scroll_x = 0.0
+        # tile once so any scroll offset is covered by a single image
+        tiled = Image.new("RGB", (self.width + WIDTH, HEIGHT))
+        for x in range(0, tiled.width, self.width):
+            tiled.paste(image, (x, 0))
+        self.photo = ImageTk.PhotoImage(tiled)
+        self.item = canvas.create_image(0, 0, image=self.photo, anchor='nw', tags="bg")
+        self._drawn_x = 0
+        self._tkcall = canvas.tk.call
+        self._cw = canvas._w
+
+    def reset(self):
+        self.scroll_x = 0.0
+
+    def update(self, dt):
+        self.scroll_x = (self.scroll_x + BG_SCROLL_SPEED * dt) % self.width
+
+    def draw(self):
+        x = -(int(self.scroll_x) % self.width)
+        if x != self._drawn_x:  # frozen outside of play: no Tcl call at all
+            self._tkcall(self._cw, 'coords', self.item, x, 0)
+            self._drawn_x = x
+
 
 class SerialReader(threading.Thread):
     """Thread lisant la série et poussant (msg, val) dans outq"""
@@ -34,61 +191,38 @@ class SerialReader(threading.Thread):
         self.port = port
         self.baud = baud
         self.outq = out_queue
-        self._stop = threading.Event()
+        self._stop_event = threading.Event()  # not _stop: that would shadow Thread._stop()
         self.ser = None
 
     def run(self):
         try:
-            self.ser = serial.Serial(self.port, self.baud, timeout=0.05)
-            print(f"[SerialReader] opened {self.port} @ {self.baud}")
+            self.ser = serial.Serial(self.port, self.baud, timeout=0.2)
+            if DEBUG:
+                print(f"[SerialReader] opened {self.port} @ {self.baud}")
         except Exception as e:
-            print(f"[SerialReader] cannot open {self.port}: {e}")
+            if LOG_ERRORS:
+                print(f"[SerialReader] cannot open {self.port}: {e}")
             return
 
-        buf = b''
-        while not self._stop.is_set():
+        buf = bytearray()
+        while not self._stop_event.is_set():
             try:
-                data = self.ser.read(128)
+                # everything already buffered, or block up to the timeout for one byte
+                data = self.ser.read(max(1, self.ser.in_waiting))
                 if data:
-                    buf += data
-                    parts = buf.split(b'\n')
-                    buf = parts[-1]  # remainder
-                    for raw in parts[:-1]:
-                        line = raw.decode(errors='ignore').strip()
-                        if not line:
-                            continue
-                        if line == "BTN":
-                            self.outq.put(("BTN", None))
-                        elif line == "BTN1":
-                            self.outq.put(("BTN1", None))
-                        elif line == "BTN2":
-                            self.outq.put(("BTN2", None))
-                        elif line.startswith("IR:"):
-                            try:
-                                v = int(line.split(":", 1)[1])
-                                self.outq.put(("IR", v))
-                            except:
-                                pass
-                        elif line.startswith("ENC:"):
-                            try:
-                                v = int(line.split(":", 1)[1])
-                                self.outq.put(("ENC", v))
-                            except:
-                                pass
-                        elif line.startswith("ULTRA:") or line.startswith("US:"):
-                            try:
-                                v = int(line.split(":", 1)[1])
-                                self.outq.put(("ULTRA", v))
-                            except:
-                                pass
-                        elif line.startswith("MAX:"):
-                            try:
-                                v = int(line.split(":", 1)[1])
-                                self.outq.put(("MAX", v))
-                            except:
-                                pass
+                    buf.extend(data)
+                    end = buf.rfind(b'\n')
+                    if end < 0:
+                        if len(buf) > 1024:  # noise without any newline
+                            del buf[:-64]
+                        continue
+                    with memoryview(buf) as view:  # one copy of the complete lines, not two
+                        lines = bytes(view[:end])
+                    del buf[:end + 1]  # keep the unterminated remainder
+                    self._dispatch(lines)
             except Exception as e:
-                print("[SerialReader] read error:", e)
+                if LOG_ERRORS:
+                    print("[SerialReader] read error:", e)
                 break
 
         try:
@@ -97,56 +231,209 @@ class SerialReader(threading.Thread):
         except:
             pass
 
+    def _dispatch(self, lines):
+        """Parse un bloc de lignes complètes et pousse les messages reconnus dans outq"""
+        batch = []
+        latest = {}  # valued messages are states: only the newest of a chunk matters
+        for raw in lines.split(b'\n'):
+            key, _, rest = raw.partition(b":")
+            entry = SERIAL_TAGS.get(key.strip())
+            if entry is None:
+                continue
+            tag, parser = entry
+            if parser is None:
+                batch.append((tag, None))
+                continue
+            try:
+                latest[tag] = parser(rest)
+            except ValueError:
+                pass
+        batch.extend(latest.items())
+        if batch:
+            self.outq.extend(batch)
+
     def stop(self):
-        self._stop.set()
+        self._stop_event.set()
 
 
-class FlappyApp:
-    def __init__(self, root, serial_port=None):
-        self.root = root
-        self.root.title("FLAPIC-BIRD 🐦")
-        self.canvas = tk.Canvas(root, width=WIDTH, height=HEIGHT)
-        self.canvas.pack()
+class SerialWriter(threading.Thread):
+    """Thread envoyant sur la série du reader les messages de in_queue, au plus un par interval"""
+    def __init__(self, reader, in_queue, interval=0.2):
+        super().__init__(daemon=True)
+        self.reader = reader
+        self.inq = in_queue
+        self.interval = interval
+        self._stop_event = threading.Event()
 
-        # --- Load images ---
-        try:
-            bg_base = Image.open("background.jpeg")
-        except Exception:
-            bg_base = Image.new("RGB", (WIDTH, HEIGHT), (135, 206, 235))
-        bg_ratio = bg_base.width / bg_base.height
-        bg_resized = bg_base.resize((int(bg_ratio * HEIGHT), HEIGHT), Image.LANCZOS)
-        self.bg_full_pil = bg_resized
-        self.bg_full_width = bg_resized.width
-        self.bg_full_height = HEIGHT
-        self.bg_scroll_x = 0.0
+    def run(self):
+        while not self._stop_event.is_set():
+            ser = self.reader.ser
+            if not (ser and ser.is_open):
+                # port not open yet: leave messages queued, statuses are only sent on change
+                self._stop_event.wait(self.interval)
+                continue
+            try:
+                msg = self.inq.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            try:
+                while True:  # only the latest status matters
+                    msg = self.inq.get_nowait()
+            except queue.Empty:
+                pass
+            if msg is None:  # shutdown sentinel from stop()
+                break
+            try:
+                ser.write(msg)
+                if DEBUG:
+                    print(f"[TX → PIC] {msg.decode().strip()}")
+            except Exception as e:
+                if LOG_ERRORS:
+                    print(f"[SerialWriter] error: {e}")
+            self._stop_event.wait(self.interval)
 
+    def stop(self):
+        self._stop_event.set()
         try:
-            pipe_base = Image.open("pipe2.png")
-            pipe_small = pipe_base.resize((pipe_base.width // 3, pipe_base.height // 3), Image.LANCZOS)
-        except Exception:
-            pipe_small = Image.new("RGBA", (60, 300), (34, 139, 34, 255))
-        self.pipe_img = ImageTk.PhotoImage(pipe_small)
-        self.pipe_img_top = ImageTk.PhotoImage(pipe_small.transpose(Image.FLIP_TOP_BOTTOM))
+            self.inq.put_nowait(None)  # wake a blocked get() right away
+        except queue.Full:
+            pass
 
-        try:
-            bird_base = Image.open("bird.png")
-            bird_small = bird_base.resize((bird_base.width // 8, bird_base.height // 8), Image.LANCZOS)
-        except Exception:
-            bird_small = Image.new("RGBA", (24, 24), (255, 200, 0, 255))
-        self.bird_base_img = bird_small
+
+class FlappyApp:
+    __slots__ = (
+        'root', 'canvas', '_tkcall', '_cw', 'running', 'state', 'queue', 'tx_queue', '_last_tx', 'serial_thread', 'serial_writer',
+        'last_time', '_next_frame', '_last_render', '_frames', '_sleep_bias', '_sleep_errs', '_sleep_idx',
+        '_after_deadline', '_msg_dispatch',
+        'bg',
+        'pipe_photos', 'pipe_w', 'bird_static_photo', 'bird_rot_cache',
+        '_item_opts', '_scene', '_screen_key', 'pipe_items', 'bird_item', 'score_text', 'best_text', 'sensor_text',
+        'test_text', 'menu_title', 'menu_best', 'menu_options', 'instr_box', 'instr_text', 'input_title',
+        'input_options', 'input_hint', 'main_menu_items', 'input_menu_items', 'gameover_items', 'scene_items',
+        '_last_score', '_last_best', '_last_sensor',
+        'menu_selection', 'in_input_menu', 'input_selection', 'input_device', 'has_played_once',
+        'show_instructions', 'best_score', 'game_over_time', 'test_mode',
+        'ir_value', 'enc_value', 'enc_center', 'ultra_value', '_target_fn',
+        'bird_y', 'bird_vy', 'bird_angle', 'score', 'pipe_x', 'pipe_gap_y', 'pipe_scored',
+        'pipe_dirty', '_rng', '_gap_pool', '_gap_idx', 'pipe_travel', '_drawn_travel', 'accumulator',
+    )
+
+    def __init__(self, root, serial_port=None, assets="default"):
+        self.root = root
+        self.root.title("FLAPIC-BIRD 🐦")
+        self.canvas = tk.Canvas(root, width=WIDTH, height=HEIGHT, highlightthickness=0, bd=0, bg='black')
+        self.canvas.pack()
+        # raw Tcl entry point for the per-frame coords/move calls, skips tkinter's option wrapping
+        self._tkcall = self.canvas.tk.call
+        self._cw = self.canvas._w
+
+        # --- Load images (decode + resize release the GIL, so run the three in parallel) ---
+        bg_path, pipe_path, pipe_div, bird_path, bird_div = ASSET_SETS[assets]
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            bg_job = pool.submit(_load_background, bg_path)
+            pipe_job = pool.submit(_load_sprite, pipe_path, pipe_div, (60, 300), (34, 139, 34, 255))
+            bird_job = pool.submit(_load_sprite, bird_path, bird_div, (24, 24), (255, 200, 0, 255))
+            bg_resized, pipe_small, bird_small = bg_job.result(), pipe_job.result(), bird_job.result()
+        self.bg = ScrollingBackground(self.canvas, bg_resized)
+
+        # one full-height image per gap position with both the top and bottom pipe on it
+        self.pipe_w, pipe_h = pipe_small.size
+        if PIPE_SPACING <= self.pipe_w + (BIRD_X_RIGHT - BIRD_X_LEFT):
+            # _collide stops at the first pipe overlapping the bird, which needs at most one at a time
+            raise ValueError(f"pipe sprite too wide ({self.pipe_w}px) for a {PIPE_SPACING:g}px pipe spacing")
+        # compile (or load from the numba cache) now rather than on the first frame of play
+        _step(np.full(MAX_PIPES, np.inf, dtype=np.float32), np.zeros(MAX_PIPES, dtype=np.float32),
+              np.zeros(MAX_PIPES, dtype=np.bool_), HEIGHT / 2, 0.0, 0.0, PHYS_DT, self.pipe_w, 0.0, False, True)
+        pipe_top = pipe_small.transpose(Image.FLIP_TOP_BOTTOM)
+        self.pipe_photos = {}
+        for gy in range(GAP_Y_MIN, GAP_Y_MAX + 1, GAP_Y_STEP):
+            pair = Image.new("RGBA", (self.pipe_w, HEIGHT), (0, 0, 0, 0))
+            pair.paste(pipe_top, (0, gy - pipe_h))
+            pair.paste(pipe_small, (0, gy + PIPE_GAP))
+            self.pipe_photos[gy] = ImageTk.PhotoImage(pair)
+
+        self.bird_static_photo = ImageTk.PhotoImage(bird_small)
+        # rotate on a square pad large enough for any angle, so every cached frame has the same size
+        side = int((bird_small.width ** 2 + bird_small.height ** 2) ** 0.5) + 1
+        bird_pad = Image.new("RGBA", (side, side), (0, 0, 0, 0))
+        bird_pad.paste(bird_small, ((side - bird_small.width) // 2, (side - bird_small.height) // 2))
+        self.bird_rot_cache = [ImageTk.PhotoImage(bird_pad.rotate(-a, resample=Image.BILINEAR))
+                               for a in range(BIRD_ANGLE_MIN, BIRD_ANGLE_MAX + 1, BIRD_ANGLE_STEP)]
+
+        # --- Persistent play items, moved/updated in place every frame ---
+        self._item_opts = {}
+        self.pipe_items = [self.canvas.create_image(0, 0, anchor='nw', state='hidden', tags=("play", "pipe"))
+                           for _ in range(MAX_PIPES)]
+        self.bird_item = self.canvas.create_image(BIRD_X, HEIGHT // 2, state='hidden', tags="play")
+        self.score_text = self.canvas.create_text(WIDTH / 2, 28, font=("Helvetica", 14, "bold"), fill="white",
+                                                  state='hidden', tags="play")
+        self.best_text = self.canvas.create_text(WIDTH - 70, 28, font=("Helvetica", 12), fill="yellow",
+                                                 state='hidden', tags="play")
+        self.sensor_text = self.canvas.create_text(70, 28, font=("Helvetica", 12), fill="cyan",
+                                                   state='hidden', tags="play")
+        self.test_text = self.canvas.create_text(80, HEIGHT - 18, text="NO COLLISION", font=("Helvetica", 10, "bold"),
+                                                 fill="red", state='hidden', tags="play")
+
+        # --- Persistent menu items, only reconfigured when what they show changes ---
+        c = self.canvas
+        self.menu_title = c.create_text(WIDTH / 2, HEIGHT * 0.14, text="FLAPIC-BIRD", font=("Helvetica", 30, "bold"),
+                                        fill="white", state='hidden', tags="menu")
+        self.menu_best = c.create_text(WIDTH - 80, 36, font=("Helvetica", 12), fill="yellow", state='hidden', tags="menu")
+        self.menu_options = [c.create_text(WIDTH / 2, HEIGHT * 0.32 + i * 48, font=("Helvetica", 18, "bold"),
+                                           state='hidden', tags="menu")
+                             for i in range(3)]
+        self.instr_box = c.create_rectangle(30, HEIGHT * 0.6, WIDTH - 30, HEIGHT - 40, fill="#5A7D7C", outline="white",
+                                            width=2, state='hidden', tags="menu")
+        instr = ("Welcome to FLAPIC-Bird!\nFly as far as possible,\navoid the pipes,\ncontrol with PIC or space.")
+        self.instr_text = c.create_text(WIDTH / 2, HEIGHT * 0.72, text=instr, font=("Helvetica", 12), fill="white",
+                                        justify="center", state='hidden', tags="menu")
+        self.input_title = c.create_text(WIDTH / 2, HEIGHT * 0.22, text="SELECT INPUT DEVICE", font=("Helvetica", 20, "bold"),
+                                         fill="white", state='hidden', tags="menu")
+        self.input_options = [c.create_text(WIDTH / 2, HEIGHT * 0.34 + i * 46, font=("Helvetica", 16),
+                                            state='hidden', tags="menu")
+                              for i in range(len(INPUT_DEVICES))]
+        self.input_hint = c.create_text(WIDTH / 2, HEIGHT - 40, text="Use up/down + Enter (or BTN1/BTN2/BTN)",
+                                        font=("Helvetica", 10), fill="white", state='hidden', tags="menu")
+        self.main_menu_items = self.menu_options + [self.instr_box, self.instr_text]
+        self.input_menu_items = [self.input_title] + self.input_options + [self.input_hint]
+
+        # --- Persistent game over items ---
+        self.gameover_items = [
+            c.create_text(WIDTH / 2, HEIGHT / 2 - 60, text="GAME OVER", font=("Helvetica", 28, "bold"), fill="white",
+                          state='hidden', tags="gameover"),
+            c.create_text(WIDTH / 2, HEIGHT / 2, font=("Helvetica", 18, "bold"), fill="white",
+                          state='hidden', tags="gameover"),
+            c.create_text(WIDTH / 2, HEIGHT / 2 + 40, font=("Helvetica", 16), fill="yellow",
+                          state='hidden', tags="gameover"),
+            c.create_text(WIDTH / 2, HEIGHT / 2 + 90, text="Returning to menu...", font=("Helvetica", 12), fill="white",
+                          state='hidden', tags="gameover"),
+        ]
+
+        self.scene_items = {
+            'play': self.pipe_items + [self.bird_item, self.score_text, self.best_text, self.sensor_text, self.test_text],
+            'menu': [self.menu_title, self.menu_best] + self.main_menu_items + self.input_menu_items,
+            'gameover': self.gameover_items,
+        }
+        self._scene = None
+        self._screen_key = None
+        self._last_score = self._last_best = self._last_sensor = None
 
 
         self.state = 'menu'
-        self.last_time = time.time()
-        self.queue = queue.Queue()
+        self.last_time = time.perf_counter_ns()   # integer ns, exact over long sessions
+        # serial thread -> Tk thread; deque append/popleft are atomic, no lock needed
+        self.queue = collections.deque(maxlen=1024)
         self.serial_thread = None
-        self.last_serial_send = 0.0
+        self.serial_writer = None
+        self.tx_queue = queue.Queue(maxsize=8)
+        self._last_tx = None
 
         self.menu_selection = 0
         self.in_input_menu = False
         self.input_selection = 0
         self.input_device = 0
 
+        self._rng = np.random.default_rng()
         self.reset_game_vars()
         self.has_played_once = False
         self.show_instructions = False
@@ -159,65 +446,109 @@ class FlappyApp:
         self.ultra_value = 25    
 
         self.bird_angle = 0.0
+        self._bind_target_fn()
         self.test_mode = False
 
-        if serial_port is None and SERIAL_AVAILABLE:
-            try:
-                import serial.tools.list_ports
-                ports = list(serial.tools.list_ports.comports())
-                if ports:
-                    serial_port = ports[0].device
-            except Exception:
-                pass
-
-        if serial_port and SERIAL_AVAILABLE:
-            try:
-                self.serial_thread = SerialReader(serial_port, SERIAL_BAUD, self.queue)
-                self.serial_thread.start()
-            except Exception as e:
-                print("[Main] serial start failed:", e)
+        self.running = True
+        if SERIAL_AVAILABLE:
+            if serial_port:
+                self._start_serial(serial_port)
+            else:
+                # port enumeration can take hundreds of ms on Windows, keep it off the Tk thread
+                threading.Thread(target=self._async_detect_port, daemon=True).start()
 
         self.root.bind('<Up>', self.key_up)
         self.root.bind('<Down>', self.key_down)
         self.root.bind('<Return>', self.key_enter)
-        self.root.bind('<space>', lambda e: self.queue.put(("BTN", None)))
+        self.root.bind('<space>', lambda e: self.queue.append(("BTN", None)))
         self.root.bind('c', lambda e: self.toggle_test_mode())
         self.root.bind('<Left>', lambda e: self.modify_sensor_value(-1))
         self.root.bind('<Right>', lambda e: self.modify_sensor_value(1))
 
-        self.running = True
-        self.root.after(int(1000 / FPS), self.loop)
+        self._msg_dispatch = {
+            "BTN": lambda v: self.handle_button(),
+            "BTN1": lambda v: self.key_up(None),
+            "BTN2": lambda v: self.key_down(None),
+            "IR": lambda v: setattr(self, 'ir_value', max(0, min(30, v))), #ICI
+            "ENC": lambda v: setattr(self, 'enc_value', v),
+            "ULTRA": lambda v: setattr(self, 'ultra_value', max(0, min(50, v))),
+            "MAX": lambda v: setattr(self, 'best_score', v),
+        }
+
+        self._next_frame = time.perf_counter() + FRAME_DT
+        self._last_render = self._next_frame - FRAME_DT
+        self._frames = 0
+        self._sleep_errs = [0.002] * (SLEEP_RING_MASK + 1)
+        self._sleep_idx = 0
+        self._sleep_bias = 0.002
+        if sys.platform == "win32":
+            import ctypes
+            ctypes.windll.winmm.timeBeginPeriod(1)   # 1 ms timer resolution for after()
+        self.tick_logic()
+        self._schedule_next()
+
+    def _start_serial(self, port):
+        try:
+            reader = SerialReader(port, SERIAL_BAUD, self.queue)
+            reader.start()
+            self.serial_writer = SerialWriter(reader, self.tx_queue)
+            self.serial_writer.start()
+            self.serial_thread = reader
+        except Exception as e:
+            if LOG_ERRORS:
+                print("[Main] serial start failed:", e)
+
+    def _async_detect_port(self):
+        try:
+            import serial.tools.list_ports
+            ports = list(serial.tools.list_ports.comports())
+        except Exception:
+            return
+        if ports and self.running:
+            self._start_serial(ports[0].device)
 
     def reset_game_vars(self):
         self.bird_y = HEIGHT / 2
         self.bird_vy = 0.0
-        self.pipes = []
-        self.pipe_timer = 0.0
+        # pipes as parallel arrays over MAX_PIPES slots, free slots have x = inf
+        self.pipe_x = np.full(MAX_PIPES, np.inf, dtype=np.float32)
+        self.pipe_gap_y = np.zeros(MAX_PIPES, dtype=np.float32)
+        self.pipe_scored = np.zeros(MAX_PIPES, dtype=np.bool_)
+        self.pipe_dirty = [False] * MAX_PIPES   # slot (re)spawned since the last draw
+        self.pipe_travel = 0.0
+        self._drawn_travel = 0     # whole pixels already applied to the pipe items
+        self.accumulator = 0.0
         self.score = 0
-        self.bg_scroll_x = 0.0
-        self.game_start_time = None
+        self.bg.reset()
         self.bird_angle = 0.0
+        # one batched draw per game instead of an interpreter RNG call per spawn
+        buckets = self._rng.integers(0, (GAP_Y_MAX - GAP_Y_MIN) // GAP_Y_STEP + 1, size=GAP_POOL_SIZE)
+        self._gap_pool = (buckets * GAP_Y_STEP + GAP_Y_MIN).tolist()
+        self._gap_idx = 0
 
     def serial_send_status(self, now):
-        if not SERIAL_AVAILABLE or not self.serial_thread or not getattr(self.serial_thread, 'ser', None):
+        reader = self.serial_thread   # may be set late by _async_detect_port
+        if not reader:
+            return
+        state_flag = 1 if self.state == 'play' else 0
+        key = (self.score, self.best_score, self.input_device, state_flag)
+        if key == self._last_tx:
             return
+        msg = ("%d|%d|%d|%d\n" % key).encode('ascii')
         try:
-            ser = self.serial_thread.ser
-            if not (ser and ser.is_open):
-                return
-            if now - self.last_serial_send < 0.2:
+            self.tx_queue.put_nowait(msg)
+        except queue.Full:
+            try:  # drop the oldest pending status, the writer only sends the latest anyway
+                self.tx_queue.get_nowait()
+                self.tx_queue.put_nowait(msg)
+            except (queue.Empty, queue.Full):
                 return
-            state_flag = 1 if self.state == 'play' else 0
-            msg = f"{self.score}|{self.best_score}|{self.input_device}|{state_flag}\n"
-            ser.write(msg.encode())
-            self.last_serial_send = now
-            print(f"[TX → PIC] {msg.strip()}")
-        except Exception as e:
-            print(f"[SerialSend] error: {e}")
+        self._last_tx = key
 
     def toggle_test_mode(self):
         self.test_mode = not self.test_mode
-        print(f"[TEST MODE] {'ON' if self.test_mode else 'OFF'}")
+        if DEBUG:
+            print(f"[TEST MODE] {'ON' if self.test_mode else 'OFF'}")
 
     def key_up(self, event):
         if self.state == 'play':
@@ -260,8 +591,10 @@ class FlappyApp:
                 self.show_instructions = not self.show_instructions
         else:
             self.input_device = self.input_selection
+            self._bind_target_fn()
             self.in_input_menu = False
-            print(f"[INPUT] selected: {INPUT_DEVICES[self.input_device]}")
+            if DEBUG:
+                print(f"[INPUT] selected: {INPUT_DEVICES[self.input_device]}")
 
     def modify_sensor_value(self, delta):
         if self.state != 'play': return
@@ -278,204 +611,275 @@ class FlappyApp:
         elif self.state == 'play':
             if self.input_device == 0:
                 self.bird_vy = FLAP_VY
-                self.bird_angle = -20.0
+                self.bird_angle = float(BIRD_ANGLE_MIN)
         elif self.state == 'gameover':
             self.state = 'menu'
 
+    def _bind_target_fn(self):
+        """Fixe la fonction sensor -> bird_y cible du capteur choisi (None pour le bouton)"""
+        if self.input_device == 1:
+            self._target_fn = lambda: SENSOR_Y30[self.ir_value] #ICI
+        elif self.input_device == 2:
+            def target():
+                if self.enc_center is None:
+                    self.enc_center = self.enc_value
+                offset = self.enc_value - self.enc_center
+                offset = -15 if offset < -15 else (15 if offset > 15 else offset)
+                return SENSOR_Y30[offset + 15]
+            self._target_fn = target
+        elif self.input_device == 3:
+            self._target_fn = lambda: ULTRA_Y[self.ultra_value]
+        else:
+            self._target_fn = None
+
     def start_game(self):
         self.reset_game_vars()
         self.state = 'play'
         self.has_played_once = True
-        self.game_start_time = time.time()
         self.game_over_time = None
         self.enc_center = None   
         for i in range(3):
-            self.pipes.append({'x': WIDTH + i * (PIPE_INTERVAL * PIPE_SPEED + 60), 'gap_y': HEIGHT * 0.5})
+            self.pipe_x[i] = WIDTH + i * (PIPE_INTERVAL * PIPE_SPEED + 60)
+            self.pipe_gap_y[i] = HEIGHT // 2
+            self.pipe_dirty[i] = True
 
     def update_physics(self, dt):
-        if self.input_device in [1, 2, 3]:
-            if self.input_device == 1:
-                pos_ratio = self.ir_value / 30.0 #ICI
-
-            elif self.input_device == 2:
-                if self.enc_center is None:
-                    self.enc_center = self.enc_value
-                offset = max(-15, min(15, self.enc_value - self.enc_center))
-                pos_ratio = (offset + 15) / 30.0
-
-            elif self.input_device == 3:
-                pos_ratio = 1.0 - (self.ultra_value / 50.0)
-
-            target_y = pos_ratio * (HEIGHT - 50)
-            self.bird_y += (target_y - self.bird_y) * 8 * dt
-
-        else:
-            self.bird_vy += GRAVITY * dt
-            self.bird_y += self.bird_vy * dt
-            target_angle = max(min((self.bird_vy / 400.0) * 60, 60), -20)
-            self.bird_angle += (target_angle - self.bird_angle) * 5 * dt
-
-        for p in self.pipes:
-            p['x'] -= PIPE_SPEED * dt
-        self.pipes = [p for p in self.pipes if p['x'] + self.pipe_img.width() > 0]
-        if len(self.pipes) == 0 or (self.pipes[-1]['x'] < WIDTH - (PIPE_SPEED * PIPE_INTERVAL)):
-            gap_y = random.randint(100, HEIGHT - PIPE_GAP - 100)
-            self.pipes.append({'x': WIDTH, 'gap_y': gap_y})
-        self.bg_scroll_x = (self.bg_scroll_x + 60 * dt) % self.bg_full_width
-
-    def check_collision(self):
-        if self.test_mode:
-            return False
-        if self.bird_y <= 0 or self.bird_y >= HEIGHT:
-            return True
-        bx1 = WIDTH * 0.25 - 10
-        bx2 = WIDTH * 0.25 + 10
-        for p in self.pipes:
-            px1 = p['x']
-            px2 = p['x'] + self.pipe_img.width()
-            gap_top = p['gap_y']
-            gap_bottom = p['gap_y'] + PIPE_GAP
-            if not (bx2 < px1 or bx1 > px2):
-                if self.bird_y < gap_top or self.bird_y > gap_bottom:
-                    return True
-            if px2 < bx1 and not p.get('scored'):
-                p['scored'] = True
-                self.score += 1
-        return False
-
-    def draw_background(self):
-        x = int(self.bg_scroll_x) % self.bg_full_width
-        visible_w = min(WIDTH, self.bg_full_width - x)
-        region = self.bg_full_pil.crop((x, 0, x + visible_w, self.bg_full_height))
-        img1 = ImageTk.PhotoImage(region)
-        self.canvas.create_image(0, 0, image=img1, anchor='nw')
-        if visible_w < WIDTH:
-            region2 = self.bg_full_pil.crop((0, 0, WIDTH - visible_w, self.bg_full_height))
-            img2 = ImageTk.PhotoImage(region2)
-            self.canvas.create_image(visible_w, 0, image=img2, anchor='nw')
-            self._bg_imgs = (img1, img2)
-        else:
-            self._bg_imgs = (img1,)
+        """Avance la partie d'un pas, renvoie True en cas de collision"""
+        target_fn = self._target_fn
+        follow = target_fn is not None
+        self.bird_y, self.bird_vy, self.bird_angle, last_x, collided, gained = _step(
+            self.pipe_x, self.pipe_gap_y, self.pipe_scored, self.bird_y, self.bird_vy, self.bird_angle,
+            dt, self.pipe_w, float(target_fn()) if follow else 0.0, follow, not self.test_mode)
+        self.score += gained
+        self.pipe_travel += PIPE_SPEED * dt
+        if last_x < PIPE_RESPAWN_X:
+            free = np.flatnonzero(self.pipe_x == np.inf)
+            if free.size:
+                i = free[0]
+                self.pipe_x[i] = WIDTH
+                self.pipe_gap_y[i] = self._gap_pool[self._gap_idx]
+                self._gap_idx = (self._gap_idx + 1) % GAP_POOL_SIZE
+                self.pipe_scored[i] = False
+                self.pipe_dirty[i] = True
+        self.bg.update(dt)
+        return collided
+
+    def _bird_photo(self, angle):
+        i = int((angle - BIRD_ANGLE_MIN) / BIRD_ANGLE_STEP + 0.5)
+        last = len(self.bird_rot_cache) - 1
+        return self.bird_rot_cache[0 if i < 0 else (last if i > last else i)]
+
+    def _configure(self, item, **opts):
+        """itemconfigure limité aux options qui ont changé depuis le dernier appel"""
+        cache = self._item_opts.setdefault(item, {})
+        changed = {k: v for k, v in opts.items() if cache.get(k) != v}
+        if changed:
+            self.canvas.itemconfigure(item, **changed)
+            cache.update(changed)
+
+    def _set_scene(self, scene):
+        if scene == self._scene:
+            return
+        self._scene = scene
+        self._screen_key = None
+        opts = self._item_opts
+        for name, items in self.scene_items.items():
+            if name != scene:
+                # every item of a scene carries the scene name as tag: hide the layer in one call
+                self._tkcall(self._cw, 'itemconfigure', name, '-state', 'hidden')
+                for item in items:
+                    opts.setdefault(item, {})['state'] = 'hidden'
 
     def draw_game(self):
-        self.canvas.delete("all")
-        self.draw_background()
-        for p in self.pipes:
-            x = p['x']; gy = p['gap_y']
-            self.canvas.create_image(x, gy - self.pipe_img_top.height(), image=self.pipe_img_top, anchor='nw')
-            self.canvas.create_image(x, gy + PIPE_GAP, image=self.pipe_img, anchor='nw')
-        bx = WIDTH * 0.25
+        self._set_scene('play')
+        self.bg.draw()
+        # every live pipe scrolls by the same amount: one Tk 'move' for all of them,
+        # explicit coords only for slots spawned since the last frame
+        shift = int(self.pipe_travel) - self._drawn_travel
+        if shift:
+            self._tkcall(self._cw, 'move', 'pipe', -shift, 0)
+            self._drawn_travel += shift
+        dirty = self.pipe_dirty
+        xs = self.pipe_x.tolist()
+        for i, item in enumerate(self.pipe_items):
+            x = xs[i]
+            if x == float('inf'):
+                self._configure(item, state='hidden')
+                continue
+            if dirty[i]:
+                self._configure(item, image=self.pipe_photos[int(self.pipe_gap_y[i])])
+                self._tkcall(self._cw, 'coords', item, int(x), 0)
+                dirty[i] = False
+            self._configure(item, state='normal')
+        bx = BIRD_X
         by = self.bird_y
-        if self.input_device == 0:
-            rotated = self.bird_base_img.rotate(-self.bird_angle, resample=Image.BICUBIC, expand=True)
-        else:
-            rotated = self.bird_base_img
-        self.bird_img = ImageTk.PhotoImage(rotated)
-        self.canvas.create_image(bx, by, image=self.bird_img)
-        self.canvas.create_text(WIDTH / 2, 28, text=f"Score: {self.score}", font=("Helvetica", 14, "bold"), fill="white")
-        self.canvas.create_text(WIDTH - 70, 28, text=f"Best: {self.best_score}", font=("Helvetica", 12), fill="yellow")
+        img = self._bird_photo(self.bird_angle) if self.input_device == 0 else self.bird_static_photo
+        self._tkcall(self._cw, 'coords', self.bird_item, bx, int(by))
+        self._configure(self.bird_item, image=img, state='normal')
+        self._configure(self.score_text, state='normal')
+        self._configure(self.best_text, state='normal')
+        if self.score != self._last_score:
+            self.canvas.itemconfigure(self.score_text, text=f"Score: {self.score}")
+            self._last_score = self.score
+        if self.best_score != self._last_best:
+            self.canvas.itemconfigure(self.best_text, text=f"Best: {self.best_score}")
+            self._last_best = self.best_score
 
         if self.input_device in (1, 2, 3):
-            label = INPUT_DEVICES[self.input_device].split()[0]
             if self.input_device == 1:
                 val = self.ir_value
             elif self.input_device == 2:
                 val = self.enc_value
             else:
                 val = self.ultra_value
-            self.canvas.create_text(70, 28, text=f"{label}: {val}", font=("Helvetica", 12), fill="cyan")
+            sensor = (self.input_device, val)
+            if sensor != self._last_sensor:
+                label = INPUT_DEVICES[self.input_device].split()[0]
+                self.canvas.itemconfigure(self.sensor_text, text=f"{label}: {val}")
+                self._last_sensor = sensor
+            self._configure(self.sensor_text, state='normal')
+        else:
+            self._configure(self.sensor_text, state='hidden')
 
-        if self.test_mode:
-            self.canvas.create_text(80, HEIGHT - 18, text="NO COLLISION", font=("Helvetica", 10, "bold"), fill="red")
+        self._configure(self.test_text, state='normal' if self.test_mode else 'hidden')
 
     def draw_gameover(self):
-        self.canvas.delete("all")
-        self.draw_background()
-        self.canvas.create_text(WIDTH / 2, HEIGHT / 2 - 60, text="GAME OVER", font=("Helvetica", 28, "bold"), fill="white")
-        self.canvas.create_text(WIDTH / 2, HEIGHT / 2, text=f"Score: {self.score}", font=("Helvetica", 18, "bold"), fill="white")
-        self.canvas.create_text(WIDTH / 2, HEIGHT / 2 + 40, text=f"Best: {self.best_score}", font=("Helvetica", 16), fill="yellow")
-        self.canvas.create_text(WIDTH / 2, HEIGHT / 2 + 90, text="Returning to menu...", font=("Helvetica", 12), fill="white")
+        self._set_scene('gameover')
+        self.bg.draw()
+        key = (self.score, self.best_score)
+        if key == self._screen_key:
+            return
+        self._screen_key = key
+        title, score, best, hint = self.gameover_items
+        self._configure(title, state='normal')
+        self._configure(score, text=f"Score: {self.score}", state='normal')
+        self._configure(best, text=f"Best: {self.best_score}", state='normal')
+        self._configure(hint, state='normal')
 
     def draw_menu(self):
-        self.canvas.delete("all")
-        self.draw_background()
-        self.canvas.create_text(WIDTH / 2, HEIGHT * 0.14, text="FLAPIC-BIRD", font=("Helvetica", 30, "bold"), fill="white")
-        self.canvas.create_text(WIDTH - 80, 36, text=f"Best: {self.best_score}", font=("Helvetica", 12), fill="yellow")
+        self._set_scene('menu')
+        self.bg.draw()
+        # everything below only depends on this key: skip it while nothing changed
+        key = (self.menu_selection, self.in_input_menu, self.input_selection, self.input_device,
+               self.show_instructions, self.has_played_once, self.best_score)
+        if key == self._screen_key:
+            return
+        self._screen_key = key
+        self._configure(self.menu_title, state='normal')
+        self._configure(self.menu_best, text=f"Best: {self.best_score}", state='normal')
         if not self.in_input_menu:
+            for item in self.input_menu_items:
+                self._configure(item, state='hidden')
             options = ["Play" if not self.has_played_once else "Replay", "Change Input Device", "Instructions"]
-            for i, t in enumerate(options):
+            for i, (item, t) in enumerate(zip(self.menu_options, options)):
                 color = "yellow" if i == self.menu_selection else "white"
-                self.canvas.create_text(WIDTH / 2, HEIGHT * 0.32 + i * 48, text=t, font=("Helvetica", 18, "bold"), fill=color)
-            if self.show_instructions:
-                frame_color = "#5A7D7C"
-                self.canvas.create_rectangle(30, HEIGHT * 0.6, WIDTH - 30, HEIGHT - 40, fill=frame_color, outline="white", width=2)
-                instr = ("Welcome to FLAPIC-Bird!\nFly as far as possible,\navoid the pipes,\ncontrol with PIC or space.")
-                self.canvas.create_text(WIDTH / 2, HEIGHT * 0.72, text=instr, font=("Helvetica", 12), fill="white", justify="center")
+                self._configure(item, text=t, fill=color, state='normal')
+            instr = 'normal' if self.show_instructions else 'hidden'
+            self._configure(self.instr_box, state=instr)
+            self._configure(self.instr_text, state=instr)
         else:
-            self.canvas.create_text(WIDTH / 2, HEIGHT * 0.22, text="SELECT INPUT DEVICE", font=("Helvetica", 20, "bold"), fill="white")
-            for i, dev in enumerate(INPUT_DEVICES):
+            for item in self.main_menu_items:
+                self._configure(item, state='hidden')
+            self._configure(self.input_title, state='normal')
+            for i, (item, dev) in enumerate(zip(self.input_options, INPUT_DEVICES)):
                 color = "yellow" if i == self.input_selection else "white"
                 marker = " ←" if i == self.input_device else ""
-                self.canvas.create_text(WIDTH / 2, HEIGHT * 0.34 + i * 46, text=dev + marker, font=("Helvetica", 16), fill=color)
-            self.canvas.create_text(WIDTH / 2, HEIGHT - 40, text="Use up/down + Enter (or BTN1/BTN2/BTN)", font=("Helvetica", 10), fill="white")
-
-    def loop(self):
-        now = time.time()
-        dt = now - self.last_time
-        self.last_time = now
-        while True:
+                self._configure(item, text=dev + marker, fill=color, state='normal')
+            self._configure(self.input_hint, state='normal')
+
+    def tick_logic(self):
+        """Vide la file série et avance la physique, toutes les LOGIC_MS ms"""
+        now_ns = time.perf_counter_ns()
+        dt = (now_ns - self.last_time) * 1e-9
+        self.last_time = now_ns
+        now = now_ns * 1e-9
+        q = self.queue
+        dispatch = self._msg_dispatch
+        while q:
             try:
-                item = self.queue.get_nowait()
-            except queue.Empty:
+                msg, val = q.popleft()
+            except IndexError:
                 break
-            if not isinstance(item, tuple):
-                continue
-            msg, val = item
-            if msg == "BTN":
-                self.handle_button()
-            elif msg == "BTN1":
-                self.key_up(None)
-            elif msg == "BTN2":
-                self.key_down(None)
-            elif msg == "IR":
-                self.ir_value = max(0, min(30, val)) #ICI
-            elif msg == "ENC":
-                self.enc_value = val
-            elif msg == "ULTRA":
-                self.ultra_value = max(0, min(50, val))
-            elif msg == "MAX":
-                self.best_score = val
+            fn = dispatch.get(msg)
+            if fn:
+                fn(val)
         self.serial_send_status(now)
-        if self.state == 'menu':
-            self.draw_menu()
-        elif self.state == 'play':
-            self.update_physics(dt)
-            collided = self.check_collision()
-            self.draw_game()
+        if self.state == 'play':
+            self.accumulator = min(self.accumulator + dt, MAX_FRAME_LAG)
+            collided = False
+            while self.accumulator >= PHYS_DT and not collided:
+                collided = self.update_physics(PHYS_DT)
+                self.accumulator -= PHYS_DT
             if collided:
                 if self.score > self.best_score:
                     self.best_score = self.score
                 self.state = 'gameover'
                 self.game_over_time = now
         elif self.state == 'gameover':
-            self.draw_gameover()
             if now - (self.game_over_time or now) > 3.0:
                 self.state = 'menu'
         if self.running:
-            self.root.after(int(1000 / FPS), self.loop)
+            self.root.after(LOGIC_MS, self.tick_logic)
+
+    def loop(self):
+        """Rendu seul, cadencé à FPS ; l'état est avancé par tick_logic"""
+        now = time.perf_counter()
+        behind = now - self._last_render > BEHIND_DT
+        self._last_render = now
+        self._frames += 1
+        # missing the frame budget: draw every other frame, the logic tick keeps game time exact
+        if not behind or self._frames & 1:
+            if self.state == 'menu':
+                self.draw_menu()
+            elif self.state == 'play':
+                self.draw_game()
+            elif self.state == 'gameover':
+                self.draw_gameover()
+            # flush this frame's item changes as one repaint instead of leaving them to the idle queue
+            self._tkcall('update', 'idletasks')
+        if self.running:
+            self._schedule_next()
+
+    def _schedule_next(self):
+        """after() jusqu'à ~1 ms de l'échéance, puis attente active dans _spin_then_loop"""
+        delay_ms = max(0, int((self._next_frame - time.perf_counter() - self._sleep_bias) * 1000) - 1)
+        self._after_deadline = time.perf_counter() + delay_ms / 1000.0
+        self.root.after(delay_ms, self._spin_then_loop)
+
+    def _spin_then_loop(self):
+        now = time.perf_counter()
+        # worst oversleep of after() over the last 64 frames, so one hiccup does not spin forever
+        i = self._sleep_idx
+        self._sleep_errs[i] = min(max(now - self._after_deadline, 0.0), FRAME_DT / 4)
+        self._sleep_idx = (i + 1) & SLEEP_RING_MASK
+        self._sleep_bias = max(self._sleep_errs)
+        while time.perf_counter() < self._next_frame:
+            pass
+        self._next_frame += FRAME_DT
+        if now - self._next_frame > FRAME_DT:
+            self._next_frame = now + FRAME_DT   # fell behind: resync instead of bursting
+        self.loop()
 
     def stop(self):
         self.running = False
-        if self.serial_thread:
-            self.serial_thread.stop()
+        threads = [t for t in (self.serial_thread, self.serial_writer) if t]
+        for t in threads:
+            t.stop()
+        for t in threads:
+            t.join(timeout=1.0)   # reader wakes within its 0.2 s read timeout, writer on the sentinel
+        if sys.platform == "win32":
+            import ctypes
+            ctypes.windll.winmm.timeEndPeriod(1)
 
 
 if __name__ == "__main__":
-    port = None
-    if len(sys.argv) >= 2:
-        port = sys.argv[1]
+    import argparse
+    parser = argparse.ArgumentParser(description="FLAPIC-BIRD")
+    parser.add_argument("port", nargs="?", help="serial port of the PIC (auto-detected if omitted)")
+    parser.add_argument("--assets", choices=sorted(ASSET_SETS), default="default", help="sprite/background set")
+    args = parser.parse_args()
     root = tk.Tk()
-    app = FlappyApp(root, serial_port=port)
+    app = FlappyApp(root, serial_port=args.port, assets=args.assets)
     try:
         root.mainloop()
     except KeyboardInterrupt: